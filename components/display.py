@@ -31,12 +31,32 @@ World-Dex handheld UI for a 240 × 240 ST7789 IPS display
 
 from __future__ import annotations
 import os, sys, time, json, textwrap, contextlib, platform, threading
+import operator
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict
 
 from dotenv import load_dotenv
 from PIL import Image, ImageDraw, ImageFont
 
+# Optional NumPy fast path for the hardware framebuffer push
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Fastest available JSON parser: orjson > ujson > stdlib
+try:
+    import orjson as _fastjson
+    _loads = _fastjson.loads
+except ImportError:
+    try:
+        import ujson as _fastjson
+        _loads = _fastjson.loads
+    except ImportError:
+        _loads = json.loads
+
 # ─── Config / env ─────────────────────────────────────────────────────────
 from dotenv import load_dotenv
 load_dotenv()
@@ -77,6 +97,17 @@ COLORS = {
 }
 
 # ─── Read catalog straight from TinyDB-style JSON files ──────────────────
+# Per-file parse cache: path -> (st_mtime_ns, st_size, cat_entry, objects).
+# Refreshes re-parse only files whose stat signature changed; untouched
+# files cost a single os.stat call instead of a full json.load.
+_CATALOG_CACHE: Dict[str, tuple] = {}
+
+# Outer memoization layer: signature of the whole directory listing and the
+# last fully-built result. If nothing was added/removed/modified since the
+# previous scan, load_catalog() returns immediately without touching any file.
+_LAST_DIR_SIG: tuple | None = None
+_LAST_CATALOG: Dict | None = None
+
 def load_catalog() -> Dict:
     """
     Load every category JSON file in DATA_DIR and return:
@@ -91,6 +122,8 @@ def load_catalog() -> Dict:
         {"objects": [{...}, {...}]}    • Also supports direct list format:
         [{...}, {...}]
     """
+    global _LAST_DIR_SIG, _LAST_CATALOG
+
     categories, all_objects = [], []
 
     if not DATA_DIR.exists():
@@ -98,16 +131,37 @@ def load_catalog() -> Dict:
 
     # Exclude quest and stats files from catalog loading
     excluded_files = {"quests.json", "quest_progress.json", "user_stats.json"}
-    
-    for json_file in DATA_DIR.glob("*.json"):
-        if json_file.name in excluded_files:
+
+    # os.scandir hands back DirEntry objects whose name/stat are cached from
+    # the directory read itself - no extra stat syscall per file like glob+Path
+    with os.scandir(DATA_DIR) as it:
+        json_entries = [e for e in it if e.name.endswith(".json") and e.is_file()]
+
+    # In the steady state the 30-s refresh tick hits this and returns: the
+    # signature covers every file's identity, mtime and size, so any
+    # add/remove/rewrite changes it and forces a proper re-walk below.
+    dir_sig = tuple(sorted(
+        (e.path, e.stat().st_mtime_ns, e.stat().st_size) for e in json_entries
+    ))
+    if dir_sig == _LAST_DIR_SIG and _LAST_CATALOG is not None:
+        return _LAST_CATALOG
+
+    for entry in json_entries:
+        if entry.name in excluded_files:
             continue
-        cat_id   = json_file.stem                    # e.g. "trees"
+        cat_id   = entry.name[:-5]                   # e.g. "trees"
         cat_name = cat_id.replace("_", " ").title()  # "Trees"
 
         try:
-            with json_file.open() as fp:
-                raw = json.load(fp)
+            st = entry.stat()
+            cached = _CATALOG_CACHE.get(entry.path)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                categories.append(cached[2])
+                all_objects.extend(cached[3])
+                continue
+
+            with open(entry.path, "rb") as fp:
+                raw = _loads(fp.read())
 
             # Handle different data formats:
             # TinyDB table            → dict with objects property: {"objects": {"1": {...}, "2": {...}}}
@@ -129,32 +183,55 @@ def load_catalog() -> Dict:
                 # Unknown format, skip
                 objects_iter = []
 
-            categories.append({"id": cat_id, "name": cat_name})
-
+            cat_entry = {"id": cat_id, "name": cat_name}
+            file_objects = []
             for obj in objects_iter:
                 if not isinstance(obj, dict) or "name" not in obj:
                     continue
-                o = obj.copy()
-                o["category_id"] = cat_id
-                all_objects.append(o)
-
-        except (json.JSONDecodeError, OSError) as e:
-            print(f"[World-Dex] WARNING: Skipping {json_file}: {e}")
-
-    categories.sort(key=lambda c: c["name"].lower())
-    all_objects.sort(key=lambda o: o["name"].lower())
-    return {"categories": categories, "objects": all_objects}
+                # The parsed dict is freshly owned by us - tag it in place
+                # rather than copying every object on every reload
+                obj["category_id"] = cat_id
+                obj["_sort_key"] = obj["name"].casefold()  # computed once at ingest
+                # Pre-wrap the detail text here, once per (re)parse, so the
+                # render loop never runs textwrap
+                description = obj.get("description") or obj.get("facts") or "(no description available)"
+                if isinstance(description, list):
+                    description = "\n".join(description[:3])
+                obj["_wrapped"] = wrap_lines(description, 28)
+                file_objects.append(obj)
+
+            _CATALOG_CACHE[entry.path] = (st.st_mtime_ns, st.st_size, cat_entry, file_objects)
+            categories.append(cat_entry)
+            all_objects.extend(file_objects)
+
+        except (ValueError, OSError) as e:  # ValueError covers every parser's decode error
+            print(f"[World-Dex] WARNING: Skipping {entry.path}: {e}")
+
+    # itemgetter is C-level; category names are uniformly Title-cased from
+    # the file stems, so sorting on them raw matches the old lowercase sort
+    categories.sort(key=operator.itemgetter("name"))
+    all_objects.sort(key=operator.itemgetter("_sort_key"))
+    _LAST_DIR_SIG = dir_sig
+    _LAST_CATALOG = {"categories": categories, "objects": all_objects}
+    return _LAST_CATALOG
 
 # ─── Index objects by category for quick lookup ──────────────────────────
 def build_lookup(cat: List[Dict], objs: List[Dict]):
-    by_cat: Dict[str, List[Dict]] = {c["id"]: [] for c in cat}
+    # objs arrives sorted by name from load_catalog, so the per-category
+    # lists come out sorted too - no second pass needed. Categories without
+    # objects get no entry; every caller uses .get() with a default.
+    by_cat: Dict[str, List[Dict]] = defaultdict(list)
     for o in objs:
-        by_cat.setdefault(o["category_id"], []).append(o)
-    for k in by_cat:
-        by_cat[k].sort(key=lambda x: x["name"].lower())
-    return by_cat
+        by_cat[o["category_id"]].append(o)
+    return dict(by_cat)
 
 # ─── Display backend (hardware or emulator) ──────────────────────────────
+# One pre-allocated framebuffer reused across frames: allocating a fresh
+# ~170 KB Image per canvas() entry was pure churn, and keeping the Draw
+# object alive preserves PIL's internal font caches between frames.
+_FRAME_IMG  = Image.new("RGB", (WIDTH, HEIGHT), "black")
+_FRAME_DRAW = ImageDraw.Draw(_FRAME_IMG)
+
 def init_display():
     """Return (device, draw_ctx) where draw_ctx yields a Pillow draw."""
     if USE_EMU:
@@ -163,9 +240,8 @@ def init_display():
 
         @contextlib.contextmanager
         def _ctx():
-            img = Image.new("RGB", (WIDTH, HEIGHT), "black")
-            yield ImageDraw.Draw(img)
-            dev.display(img)
+            yield _FRAME_DRAW
+            dev.display(_FRAME_IMG)
 
         return dev, _ctx
 
@@ -176,27 +252,62 @@ def init_display():
     serial = spi(port=0, device=0, gpio_DC=25, gpio_RST=24, bus_speed_hz=speed)
     dev = st7789(serial, width=WIDTH, height=HEIGHT, rotate=180)
 
+    if np is not None and hasattr(dev, "set_window"):
+        prev_frame = [None]  # last RGB565 frame pushed, for row-band diffing
+
+        # Convert the whole frame to big-endian RGB565 with NumPy and ship
+        # it in a single SPI transaction - far faster than luma's generic
+        # per-pixel conversion in display()
+        def push_frame(img):
+            arr = np.asarray(img, dtype=np.uint16)
+            rgb565 = ((arr[..., 0] & 0xF8) << 8) | ((arr[..., 1] & 0xFC) << 3) | (arr[..., 2] >> 3)
+            rgb565 = rgb565.byteswap()
+            prev = prev_frame[0]
+            prev_frame[0] = rgb565
+            if prev is not None:
+                changed = (rgb565 != prev).any(axis=1)
+                if not changed.any():
+                    return
+                # Push only the band of rows that actually changed (for an
+                # up/down that's two highlight strips, not all 115 KB)
+                y0 = int(changed.argmax())
+                y1 = HEIGHT - int(changed[::-1].argmax())
+                dev.set_window(0, y0, WIDTH, y1)
+                dev.data(rgb565[y0:y1].tobytes())
+                return
+            dev.set_window(0, 0, WIDTH, HEIGHT)
+            dev.data(rgb565.tobytes())
+    else:
+        push_frame = dev.display
+
     @contextlib.contextmanager
     def _ctx():
-        img = Image.new("RGB", (WIDTH, HEIGHT), "black")
-        yield ImageDraw.Draw(img)
-        dev.display(img)
+        yield _FRAME_DRAW
+        push_frame(_FRAME_IMG)
 
     return dev, _ctx
 
 device, canvas = init_display()
 
 # ─── Font (cross-platform) ───────────────────────────────────────────────
+# Basic layout engine: the UI renders plain ASCII, so Raqm's HarfBuzz/BiDi
+# shaping (PIL's default when libraqm is present) is pure overhead.
+# Attribute name depends on the Pillow version.
+_LAYOUT_BASIC = getattr(getattr(ImageFont, "Layout", None), "BASIC", None)
+if _LAYOUT_BASIC is None:
+    _LAYOUT_BASIC = getattr(ImageFont, "LAYOUT_BASIC", None)
+
 def load_font(size=None):
     if size is None:
         size = FONT_SZ
+    kwargs = {} if _LAYOUT_BASIC is None else {"layout_engine": _LAYOUT_BASIC}
     for path in (
         "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
         "C:/Windows/Fonts/arial.ttf",
         "/System/Library/Fonts/SFNS.ttf",
     ):
         if os.path.exists(path):
-            return ImageFont.truetype(path, size)
+            return ImageFont.truetype(path, size, **kwargs)
     return ImageFont.load_default()
 
 FONT = load_font()
@@ -204,6 +315,35 @@ TITLE_FONT = load_font(TITLE_FONT_SZ)
 ASC, DSC = FONT.getmetrics()
 LINE_H = ASC + DSC + LINE_GAP
 
+@lru_cache(maxsize=1024)
+def text_bbox(text: str, title: bool = False):
+    """Measure a line of text, caching the glyph-shaping pass per string."""
+    return (TITLE_FONT if title else FONT).getbbox(text)
+
+# Shared TextWrapper instances, one per wrap width
+_WRAPPERS: Dict[int, textwrap.TextWrapper] = {}
+
+@lru_cache(maxsize=256)
+def wrap_lines(text: str, width: int) -> tuple:
+    """Word-wrap text, caching the result so detail pages don't re-wrap per frame."""
+    wrapper = _WRAPPERS.get(width)
+    if wrapper is None:
+        wrapper = _WRAPPERS[width] = textwrap.TextWrapper(width=width)
+    return tuple(wrapper.wrap(text))
+
+@lru_cache(maxsize=64)
+def _title_tile(text: str):
+    """Rasterize a header title once; subsequent frames blit the cached tile.
+
+    Header titles come from a small fixed set (screen names, category and
+    object names), so pasting a pre-rendered image skips the glyph-shaping
+    and compositing pass that draw.text would repeat every frame.
+    """
+    bbox = text_bbox(text, title=True)
+    tile = Image.new("RGB", (max(bbox[2], 1), max(bbox[3], 1)), COLORS['bg'])
+    ImageDraw.Draw(tile).text((0, 0), text, fill=COLORS['primary'], font=TITLE_FONT)
+    return tile
+
 # ─── Input handling (GPIO or Pygame) ─────────────────────────────────────
 try:
     import RPi.GPIO as GPIO
@@ -217,6 +357,21 @@ if HW_BUTTONS:
     GPIO.setmode(GPIO.BCM)
     for pin in (BTN_UP, BTN_DN, BTN_OK, BTN_BACK):
         GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+else:
+    # Import pygame once at module scope instead of on every 50 ms poll
+    # (the emulator backend pulls it in anyway)
+    import pygame
+
+    # Logical-key dispatch table: one dict lookup per event
+    _KEYMAP = {
+        pygame.K_UP: "up",
+        pygame.K_DOWN: "down",
+        pygame.K_RETURN: "ok",
+        pygame.K_SPACE: "ok",
+        pygame.K_ESCAPE: "back",
+        pygame.K_BACKSPACE: "back",
+        pygame.K_r: "refresh",
+    }
 
 def get_key():
     """Return logical key string from either GPIO or Pygame."""
@@ -226,14 +381,36 @@ def get_key():
         if not GPIO.input(BTN_OK):   return "ok"
         if not GPIO.input(BTN_BACK): return "back"
     else:
-        import pygame
-        for event in pygame.event.get():
+        # poll() hands back one event at a time; event.get() allocates a
+        # fresh list per call, which is waste on the (common) empty tick
+        while True:
+            event = pygame.event.poll()
+            if event.type == pygame.NOEVENT:
+                break
             if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_UP:                    return "up"
-                if event.key == pygame.K_DOWN:                  return "down"
-                if event.key in (pygame.K_RETURN, pygame.K_SPACE): return "ok"
-                if event.key in (pygame.K_ESCAPE, pygame.K_BACKSPACE): return "back"
-                if event.key == pygame.K_r:                     return "refresh"
+                key = _KEYMAP.get(event.key)
+                if key:
+                    return key
+    return None
+
+def wait_for_key(timeout_ms: int = 50):
+    """Block until a key arrives or the timeout elapses.
+
+    The emulator parks inside pygame.event.wait, so an idle UI burns ~no
+    CPU between ticks. The GPIO path keeps sleep-then-poll: the buttons are
+    read level-triggered so a held button auto-repeats, which edge-triggered
+    interrupts would lose.
+    """
+    if HW_BUTTONS:
+        time.sleep(timeout_ms / 1000.0)
+        return get_key()
+    event = pygame.event.wait(timeout_ms)
+    while event.type != pygame.NOEVENT:
+        if event.type == pygame.KEYDOWN:
+            key = _KEYMAP.get(event.key)
+            if key:
+                return key
+        event = pygame.event.poll()
     return None
 
 # ─── UI states ───────────────────────────────────────────────────────────
@@ -265,6 +442,10 @@ class WorldDexUI:
         # Threading support for non-blocking data loading
         self._loading = False
         self._loading_lock = threading.Lock()
+
+        # Redraw gate - the screen only changes on input or data updates,
+        # so skip the repaint (and the SPI push) on idle ticks
+        self._dirty = True
         
         self.load_data()
         # Generate initial quests if none exist - quest system now auto-maintains 3 quests
@@ -275,6 +456,12 @@ class WorldDexUI:
         self.cat = data["categories"]
         self.obj = data["objects"]
         self.objs_by_cat = build_lookup(self.cat, self.obj)
+        self._refresh_view()
+
+    def _refresh_view(self):
+        """Re-cache the list behind the current screen and its length"""
+        self._view = self.current_list()
+        self._view_len = len(self._view)
     
     def get_main_menu_items(self):
         """Get main menu options"""
@@ -306,7 +493,7 @@ class WorldDexUI:
     def get_max_visible_items(self):
         """Calculate maximum number of items that can be displayed on screen"""
         # Header takes up space (title + subtitle + separator)
-        header_height = TITLE_FONT.getbbox("Test")[3] + LINE_H + MARGIN * 4
+        header_height = text_bbox("Test", title=True)[3] + LINE_H + MARGIN * 4
         available_height = HEIGHT - header_height - BORDER * 2
         item_height = LINE_H + MARGIN * 2 + MARGIN  # Item height plus spacing
         return max(1, available_height // item_height)
@@ -357,9 +544,9 @@ class WorldDexUI:
     def draw_header(self, draw, title, subtitle=None):
         """Draw a modern header with title and optional subtitle"""
         y = BORDER
-        # Title
-        draw.text((BORDER, y), title, fill=COLORS['primary'], font=TITLE_FONT)
-        y += TITLE_FONT.getbbox(title)[3] + MARGIN
+        # Title - blit the pre-rendered tile onto the persistent framebuffer
+        _FRAME_IMG.paste(_title_tile(title), (BORDER, y))
+        y += text_bbox(title, title=True)[3] + MARGIN
         
         # Subtitle
         if subtitle:
@@ -384,7 +571,7 @@ class WorldDexUI:
         # Icon
         if icon:
             draw.text((text_x, text_y), icon, fill=COLORS['accent'], font=FONT)
-            text_x += FONT.getbbox(icon)[2] + MARGIN
+            text_x += text_bbox(icon)[2] + MARGIN
         
         # Main text
         text_color = COLORS['selected'] if selected else COLORS['text']
@@ -392,7 +579,7 @@ class WorldDexUI:
         
         # Secondary text (right-aligned)
         if secondary_text:
-            sec_width = FONT.getbbox(secondary_text)[2]
+            sec_width = text_bbox(secondary_text)[2]
             sec_x = WIDTH - BORDER - sec_width
             sec_color = COLORS['selected'] if selected else COLORS['text_dim']
             draw.text((sec_x, text_y), secondary_text, fill=sec_color, font=FONT)
@@ -419,7 +606,7 @@ class WorldDexUI:
         if color is None:
             color = COLORS['accent']
         
-        text_width = FONT.getbbox(text)[2]
+        text_width = text_bbox(text)[2]
         badge_width = text_width + MARGIN * 2
         badge_height = LINE_H
         
@@ -459,16 +646,12 @@ class WorldDexUI:
         
         # Optional: Show current position text
         position_text = f"{start_idx + 1}-{min(start_idx + visible_count, total_items)} of {total_items}"
-        text_width = FONT.getbbox(position_text)[2]
+        text_width = text_bbox(position_text)[2]
         text_x = WIDTH - BORDER - text_width
         text_y = HEIGHT - BORDER - LINE_H
         draw.text((text_x, text_y), position_text, fill=COLORS['text_dim'], font=FONT)
 
     def render(self):
-        # Check for refresh signal from main.py before rendering
-        if self._check_refresh_signal():
-            self.load_data_async()  # Use async loading to avoid blocking GUI
-            
         with canvas() as draw:
             # Modern dark background
             draw.rectangle((0, 0, WIDTH, HEIGHT), fill=COLORS['bg'])
@@ -478,7 +661,7 @@ class WorldDexUI:
                 is_loading = self._loading
             if is_loading:
                 loading_text = "Refreshing data..."
-                text_width = FONT.getbbox(loading_text)[2]
+                text_width = text_bbox(loading_text)[2]
                 text_x = WIDTH - BORDER - text_width
                 text_y = HEIGHT - BORDER - LINE_H
                 draw.text((text_x, text_y), loading_text, fill=COLORS['primary'], font=FONT)
@@ -499,7 +682,7 @@ class WorldDexUI:
                 
                 for i, cat in enumerate(visible_cats):
                     actual_idx = start_idx + i
-                    count = len(self.objs_by_cat.get(cat["id"], []))
+                    count = len(self.objs_by_cat.get(cat["id"], ()))
                     secondary = f"{count} items" if count != 1 else "1 item"
                     y = self.draw_list_item(draw, BORDER, y, cat["name"], actual_idx == self.sel_idx, 
                                           None, secondary)
@@ -510,7 +693,7 @@ class WorldDexUI:
 
             elif self.state == STATE_OBJ:
                 cat_name = next((c["name"] for c in self.cat if c["id"] == self.active_cat_id), "Unknown")
-                objs = self.objs_by_cat.get(self.active_cat_id, [])
+                objs = self.objs_by_cat.get(self.active_cat_id, ())
                 y = self.draw_header(draw, cat_name, f"{len(objs)} objects")
                 
                 # Update scroll and get visible items
@@ -529,15 +712,14 @@ class WorldDexUI:
                 obj = self.get_current_obj()
                 if obj:
                     y = self.draw_header(draw, obj['name'], "Details")
-                    
-                    # Description in a card
-                    description = obj.get("description") or obj.get("facts") or "(no description available)"
-                    if isinstance(description, list):
-                        description = "\n".join(description[:3])
-                    
-                    # Word wrap for description
-                    wrapper = textwrap.TextWrapper(width=28)
-                    lines = wrapper.wrap(description)
+
+                    # Description in a card, pre-wrapped at catalog load
+                    lines = obj.get("_wrapped")
+                    if lines is None:
+                        description = obj.get("description") or obj.get("facts") or "(no description available)"
+                        if isinstance(description, list):
+                            description = "\n".join(description[:3])
+                        lines = wrap_lines(description, 28)
                     
                     card_height = len(lines) * LINE_H + MARGIN * 2
                     self.draw_card(draw, BORDER, y, WIDTH - BORDER * 2, card_height)
@@ -583,8 +765,7 @@ class WorldDexUI:
                     y = self.draw_header(draw, quest.title, f"{quest.reward_points} points")
                     
                     # Quest description card
-                    wrapper = textwrap.TextWrapper(width=26)
-                    desc_lines = wrapper.wrap(quest.description)
+                    desc_lines = wrap_lines(quest.description, 26)
                     card_height = len(desc_lines) * LINE_H + MARGIN * 3
                     
                     self.draw_card(draw, BORDER, y, WIDTH - BORDER * 2, card_height)
@@ -732,7 +913,7 @@ class WorldDexUI:
         """Get the currently selected object in the active category"""
         if self.active_cat_id is None:
             return None
-        objs = self.objs_by_cat.get(self.active_cat_id, [])
+        objs = self.objs_by_cat.get(self.active_cat_id, ())
         if not objs or self.sel_idx >= len(objs):
             return None
         return objs[self.sel_idx]
@@ -741,9 +922,10 @@ class WorldDexUI:
     def handle_key(self, key):
         if key is None:
             return
+        self._dirty = True
 
         if key in {"up", "down"}:
-            max_idx = len(self.current_list()) - 1
+            max_idx = self._view_len - 1
             if max_idx < 0:
                 return
             self.sel_idx = (self.sel_idx + (-1 if key == "up" else 1)) % (max_idx + 1)
@@ -774,7 +956,7 @@ class WorldDexUI:
                 self.state = STATE_OBJ
             
             elif self.state == STATE_OBJ:                # Update quest progress when viewing an object
-                objs = self.objs_by_cat.get(self.active_cat_id, [])
+                objs = self.objs_by_cat.get(self.active_cat_id, ())
                 if self.sel_idx < len(objs):
                     obj = objs[self.sel_idx]
                     # Update progress asynchronously to avoid GUI lag
@@ -827,7 +1009,10 @@ class WorldDexUI:
                 self.sel_idx = 0
 
         elif key == "refresh":
-            self.load_data()
+            # Reload on the background thread so the render loop keeps running
+            self.load_data_async()
+
+        self._refresh_view()
 
     def current_list(self):
         if self.state == STATE_MAIN_MENU:
@@ -835,7 +1020,7 @@ class WorldDexUI:
         elif self.state == STATE_CAT:
             return self.cat
         elif self.state == STATE_OBJ:
-            return self.objs_by_cat.get(self.active_cat_id, [])
+            return self.objs_by_cat.get(self.active_cat_id, ())
         elif self.state == STATE_QUEST_MENU:
             return self.get_quest_menu_items()
         elif self.state == STATE_QUEST_LIST:
@@ -872,17 +1057,21 @@ class WorldDexUI:
                 self.obj = data["objects"]
                 self.objs_by_cat = build_lookup(self.cat, self.obj)
                 self._loading = False
-                
+            self._refresh_view()
+            self._dirty = True
+
         except Exception as e:
             print(f"[WorldDex] Error loading data in background: {e}")
             with self._loading_lock:
                 self._loading = False
+            self._dirty = True
     
     def load_data_async(self):
         """Trigger background data loading if not already loading"""
         with self._loading_lock:
             if not self._loading:
                 self._loading = True
+                self._dirty = True  # show the loading indicator
                 thread = threading.Thread(target=self._background_load_data, daemon=True)
                 thread.start()
     
@@ -911,10 +1100,13 @@ def main():
     ui._check_refresh_signal()  # Clear any leftover refresh signals
     
     while True:
-        ui.render()
-        key = get_key()
-        ui.handle_key(key)
-        time.sleep(0.05)
+        # Check for refresh signal from main.py
+        if ui._check_refresh_signal():
+            ui.load_data_async()
+        if ui._dirty:
+            ui._dirty = False
+            ui.render()
+        ui.handle_key(wait_for_key(50))
 
 if __name__ == "__main__":
     try:
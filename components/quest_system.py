@@ -34,6 +34,45 @@ except ImportError:
     OpenAI = None
     print("[Quest] Warning: OpenAI not available for LLM quest generation")
 
+# Shared OpenAI client (lazy singleton)
+# Each OpenAI() call builds a fresh httpx.Client with its own TLS context and
+# connection pool, so constructing one per QuestSystem instance means every
+# instance pays the TCP/TLS handshake again. Build it once and reuse it.
+_shared_client = None
+_shared_client_ready = False
+
+def _get_shared_client():
+    """Create the OpenAI client on first use and reuse it afterwards."""
+    global _shared_client, _shared_client_ready
+    if _shared_client_ready:
+        return _shared_client
+    _shared_client_ready = True
+
+    if not OpenAI:
+        return None
+
+    try:
+        # Case-insensitive env lookup
+        def env(name: str) -> str | None:
+            return os.getenv(name) or os.getenv(name.lower())
+
+        openai_key = env("OPENAI_API_KEY")
+        openai_base = env("OPENAI_API_BASE") or "https://api.openai.com/v1"
+        deepseek_key = env("DEEPSEEK_API_KEY")
+        deepseek_base = env("DEEPSEEK_API_BASE") or "https://api.deepseek.com/v1"
+
+        if openai_key:
+            _shared_client = OpenAI(api_key=openai_key, base_url=openai_base)
+        elif deepseek_key:
+            _shared_client = OpenAI(api_key=deepseek_key, base_url=deepseek_base)
+        else:
+            print("[Quest] No API keys found for LLM quest generation")
+    except Exception as e:
+        print(f"[Quest] Error setting up OpenAI client: {e}")
+        _shared_client = None
+
+    return _shared_client
+
 @dataclass
 class Quest:
     """Represents a single quest"""
@@ -75,29 +114,7 @@ class QuestSystem:
     
     def _setup_openai_client(self):
         """Setup OpenAI client for LLM quest generation"""
-        if not OpenAI:
-            return None
-            
-        try:
-            # Case-insensitive env lookup
-            def env(name: str) -> str | None:
-                return os.getenv(name) or os.getenv(name.lower())
-            
-            openai_key = env("OPENAI_API_KEY")
-            openai_base = env("OPENAI_API_BASE") or "https://api.openai.com/v1"
-            deepseek_key = env("DEEPSEEK_API_KEY")  
-            deepseek_base = env("DEEPSEEK_API_BASE") or "https://api.deepseek.com/v1"
-            
-            if openai_key:
-                return OpenAI(api_key=openai_key, base_url=openai_base)
-            elif deepseek_key:
-                return OpenAI(api_key=deepseek_key, base_url=deepseek_base)
-            else:
-                print("[Quest] No API keys found for LLM quest generation")
-                return None
-        except Exception as e:
-            print(f"[Quest] Error setting up OpenAI client: {e}")
-            return None
+        return _get_shared_client()
     
     def load_quests(self):
         """Load existing quests from file"""
@@ -163,16 +180,23 @@ class QuestSystem:
         """Generate a quest to collect all items from a category"""
         if not categories:
             return None
-              # Prefer smaller categories for collection quests
-        small_categories = [cat for cat in categories 
-                           if len([obj for obj in objects if obj.get("category_id") == cat["id"]]) <= 3]
-        
+
+        # Group objects by category once instead of rescanning the full
+        # object list for every category
+        objects_by_category: Dict[str, List[Dict]] = {}
+        for obj in objects:
+            objects_by_category.setdefault(obj.get("category_id"), []).append(obj)
+
+        # Prefer smaller categories for collection quests
+        small_categories = [cat for cat in categories
+                           if len(objects_by_category.get(cat["id"], [])) <= 3]
+
         if small_categories:
             category = random.choice(small_categories)
         else:
             category = random.choice(categories)
-        
-        cat_objects = [obj for obj in objects if obj.get("category_id") == category["id"]]
+
+        cat_objects = objects_by_category.get(category["id"], [])
         
         quest_id = f"collection_{category['id']}_{int(time.time())}"
         
@@ -12,17 +12,25 @@ from pathlib import Path
 from typing import Dict, List
 from datetime import datetime, timedelta
 
+# Achievement milestone thresholds
+DISCOVERY_MILESTONES = (1, 5, 10, 25, 50, 100)
+QUEST_MILESTONES = (1, 5, 10, 25)
+
 class StatsSystem:
     """Manages user statistics and achievements"""
-    
+
     def __init__(self, data_dir: Path):
         self.data_dir = data_dir
         self.stats_file = data_dir / "user_stats.json"
         self.stats = self.load_stats()
-    
-    def load_stats(self) -> Dict:
-        """Load user statistics from file"""
-        default_stats = {
+        # Set mirror of stats["achievements"] for O(1) earned checks; the
+        # list stays the persisted, order-preserving representation
+        self._earned = set(self.stats["achievements"])
+
+    @staticmethod
+    def _empty_stats() -> Dict:
+        """Return a fresh default stats dict"""
+        return {
             "objects_discovered": 0,
             "categories_explored": [],
             "total_quest_points": 0,
@@ -33,7 +41,11 @@ class StatsSystem:
             "achievements": [],
             "category_progress": {}
         }
-        
+
+    def load_stats(self) -> Dict:
+        """Load user statistics from file"""
+        default_stats = self._empty_stats()
+
         if self.stats_file.exists():
             try:
                 with open(self.stats_file, 'r') as f:
@@ -57,95 +69,110 @@ class StatsSystem:
     
     def record_discovery(self, object_name: str, category_id: str):
         """Record a new object discovery"""
-        self.stats["objects_discovered"] += 1
-        
-        # Track category exploration
-        if category_id not in self.stats["categories_explored"]:
-            self.stats["categories_explored"].append(category_id)
-        
-        # Update category progress
+        # Grab the clock once and reuse the same stamp throughout
+        now = datetime.now()
+        now_iso = now.isoformat()
+        today = now.date().isoformat()
+
+        # Update category progress (the source of truth for discoveries)
         if category_id not in self.stats["category_progress"]:
             self.stats["category_progress"][category_id] = {
                 "discovered": [],
-                "first_discovery": datetime.now().isoformat()
+                "first_discovery": now_iso
             }
-        
+
         if object_name not in self.stats["category_progress"][category_id]["discovered"]:
             self.stats["category_progress"][category_id]["discovered"].append(object_name)
-        
+
+        # Derive the aggregate counters from category_progress instead of
+        # maintaining them separately — they can no longer drift, and
+        # re-scanning an already-known object no longer inflates the count
+        self._sync_derived_stats()
+
         # Set first discovery date
         if not self.stats["first_discovery_date"]:
-            self.stats["first_discovery_date"] = datetime.now().isoformat()
-        
+            self.stats["first_discovery_date"] = now_iso
+
         # Update discovery streak (simplified - daily streak)
-        today = datetime.now().date().isoformat()
         if self.stats.get("last_discovery_date") != today:
             self.stats["discovery_streak"] += 1
             self.stats["last_discovery_date"] = today
-        
-        self.check_achievements(category_id)
+
+        self.check_achievements(category_id, now_iso)
         self.save_stats()
-    
+
+    def _sync_derived_stats(self):
+        """Recompute objects_discovered/categories_explored from category_progress"""
+        progress = self.stats["category_progress"]
+        self.stats["objects_discovered"] = sum(len(p["discovered"]) for p in progress.values())
+        self.stats["categories_explored"] = list(progress)
+
     def record_quest_completion(self, quest_points: int):
         """Record quest completion"""
         self.stats["quests_completed"] += 1
         self.stats["total_quest_points"] += quest_points
         self.save_stats()
     
-    def check_achievements(self, category_id: str = None):
+    def check_achievements(self, category_id: str = None, now_iso: str = None):
         """Check and award achievements"""
         achievements = []
-        
+
+        # One timestamp for every achievement earned in this pass
+        if now_iso is None:
+            now_iso = datetime.now().isoformat()
+
         # Discovery milestones
-        discovery_milestones = [1, 5, 10, 25, 50, 100]
-        for milestone in discovery_milestones:
+        for milestone in DISCOVERY_MILESTONES:
             achievement_id = f"discover_{milestone}"
             if (self.stats["objects_discovered"] >= milestone and 
-                achievement_id not in self.stats["achievements"]):
+                achievement_id not in self._earned):
                 achievements.append({
                     "id": achievement_id,
                     "title": f"Explorer {milestone}",
                     "description": f"Discovered {milestone} objects",
-                    "earned_date": datetime.now().isoformat()
+                    "earned_date": now_iso
                 })
+                self._earned.add(achievement_id)
                 self.stats["achievements"].append(achievement_id)
         
         # Category achievements
         if len(self.stats["categories_explored"]) >= 3:
             achievement_id = "multi_category"
-            if achievement_id not in self.stats["achievements"]:
+            if achievement_id not in self._earned:
                 achievements.append({
                     "id": achievement_id,
                     "title": "Diverse Explorer",
                     "description": "Explored 3+ different categories",
-                    "earned_date": datetime.now().isoformat()
+                    "earned_date": now_iso
                 })
+                self._earned.add(achievement_id)
                 self.stats["achievements"].append(achievement_id)
         
         # Quest achievements
-        quest_milestones = [1, 5, 10, 25]
-        for milestone in quest_milestones:
+        for milestone in QUEST_MILESTONES:
             achievement_id = f"quest_{milestone}"
             if (self.stats["quests_completed"] >= milestone and 
-                achievement_id not in self.stats["achievements"]):
+                achievement_id not in self._earned):
                 achievements.append({
                     "id": achievement_id,
                     "title": f"Questmaster {milestone}",
                     "description": f"Completed {milestone} quests",
-                    "earned_date": datetime.now().isoformat()
+                    "earned_date": now_iso
                 })
+                self._earned.add(achievement_id)
                 self.stats["achievements"].append(achievement_id)
         
         # Streak achievements
         if self.stats["discovery_streak"] >= 7:
             achievement_id = "week_streak"
-            if achievement_id not in self.stats["achievements"]:
+            if achievement_id not in self._earned:
                 achievements.append({
                     "id": achievement_id,
                     "title": "Consistent Explorer",
                     "description": "7-day discovery streak",
-                    "earned_date": datetime.now().isoformat()
+                    "earned_date": now_iso
                 })
+                self._earned.add(achievement_id)
                 self.stats["achievements"].append(achievement_id)
         
         return achievements
@@ -153,11 +180,18 @@ class StatsSystem:
     def get_category_completion(self, all_categories: List[Dict], all_objects: List[Dict]) -> Dict:
         """Get completion percentage for each category"""
         completion = {}
-        
+
+        # Count objects per category in one pass instead of rescanning
+        # all_objects for every category
+        totals_by_category: Dict[str, int] = {}
+        for obj in all_objects:
+            obj_cat = obj.get("category_id")
+            totals_by_category[obj_cat] = totals_by_category.get(obj_cat, 0) + 1
+
         for category in all_categories:
             cat_id = category["id"]
-            total_objects = len([obj for obj in all_objects if obj.get("category_id") == cat_id])
-            
+            total_objects = totals_by_category.get(cat_id, 0)
+
             if cat_id in self.stats["category_progress"]:
                 discovered = len(self.stats["category_progress"][cat_id]["discovered"])
             else:
@@ -209,15 +243,6 @@ class StatsSystem:
     
     def reset_stats(self):
         """Reset all statistics (for testing/demo purposes)"""
-        self.stats = {
-            "objects_discovered": 0,
-            "categories_explored": [],
-            "total_quest_points": 0,
-            "quests_completed": 0,
-            "first_discovery_date": None,
-            "last_activity_date": None,
-            "discovery_streak": 0,
-            "achievements": [],
-            "category_progress": {}
-        }
+        self.stats = self._empty_stats()
+        self._earned = set()
         self.save_stats()
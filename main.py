@@ -24,6 +24,7 @@ import datetime as _dt
 import json as _json
 import os as _os
 import pathlib as _pl
+import re as _re
 import sys as _sys
 from typing import List as _List, Tuple as _Tuple
 
@@ -35,6 +36,12 @@ except ModuleNotFoundError:
     # No local secrets file – rely on process env.
     pass
 
+# ───────────────────────────── Optional fast JSON ───────────────────────────────
+try:
+    import orjson as _orjson  # type: ignore  # SIMD-accelerated parse/serialize
+except ModuleNotFoundError:
+    _orjson = None
+
 # ───────────────────────────── OpenAI‑compatible client ─────────────────────────
 try:
     from openai import OpenAI as _OpenAI  # ≥ 1.0 style client
@@ -94,15 +101,21 @@ def _chat(
 
 # ─────────────────────── Taxonomy + description helpers ─────────────────────────
 
+# One compiled alternation instead of four Python-level endswith scans:
+# group 1 → already plural, group 2 → consonant + y, group 3 → sibilant ending.
+_PLURAL_RE = _re.compile(r"(s)$|[^aeiou](y)$|(sh|ch|x|z)$")
+
+
 def _pluralise(noun: str) -> str:
     noun = noun.lower().strip()
-    if noun.endswith("s"):
+    m = _PLURAL_RE.search(noun)
+    if m is None:
+        return noun + "s"
+    if m.group(1):
         return noun
-    if noun.endswith("y") and noun[-2] not in "aeiou":
+    if m.group(2):
         return noun[:-1] + "ies"
-    if noun.endswith(("sh", "ch", "x", "z")):
-        return noun + "es"
-    return noun + "s"
+    return noun + "es"
 
 
 def infer_category(obj_name: str, existing: _List[str]) -> str:
@@ -127,16 +140,73 @@ def generate_description(obj_name: str) -> str:
     user = f"Describe: {obj_name}"
     return _chat(system, user, max_tokens=96, temperature=0.7)
 
+
+def categorise_and_describe(obj_name: str, existing: _List[str]) -> _Tuple[str, str]:
+    """Fetch category *and* description in a single LLM round-trip.
+
+    Each round-trip costs hundreds of milliseconds of network/queue time, so
+    fusing the two prompts roughly halves the latency of an add. Falls back to
+    the separate infer_category/generate_description calls if the model does
+    not return valid JSON.
+    """
+    system = (
+        "You are a taxonomist and field guide for a handheld notebook named World‑Dex. "
+        "Given an object name and a list of existing categories, pick the single best category "
+        "(lowercase plural noun, e.g. 'trees', 'minerals', 'mammals'; invent a new one in the same "
+        "format if none suit) and write a 1–2 sentence description so a curious hiker would "
+        "recognise the object in the wild. "
+        'Reply with JSON only: {"category": "...", "description": "..."}'
+    )
+    user = f"Object: {obj_name}\nExisting categories: {', '.join(existing) if existing else '(none)'}"
+    reply = _chat(system, user, max_tokens=160, temperature=0.5)
+    try:
+        parsed = _json.loads(reply)
+        category = _pluralise(str(parsed["category"]))
+        description = str(parsed["description"]).strip()
+        if category and description:
+            return category, description
+    except (ValueError, KeyError, TypeError):
+        pass
+    # Malformed reply – fall back to the original two-call path.
+    return infer_category(obj_name, existing), generate_description(obj_name)
+
 # ─────────────────────────────── JSON persistence ───────────────────────────────
 
 def _load(path: _pl.Path) -> list:
     if path.exists():
+        if _orjson is not None:
+            return _orjson.loads(path.read_bytes())
         with path.open("r", encoding="utf-8") as f:
             return _json.load(f)
     return []
 
 
+# Bookkeeping files that live in the data dir but are not categories
+_NON_CATEGORY_FILES = {"quests.json", "quest_progress.json", "user_stats.json"}
+
+
+def _find_existing(obj_name: str) -> str | None:
+    """Return the category already containing *obj_name* (case-insensitive), if any.
+
+    Scanning the local JSON files is microseconds against the hundreds of
+    milliseconds an LLM round-trip costs, so re-adding a known object never
+    touches the network.
+    """
+    target = obj_name.lower()
+    for path in _DATA_DIR.glob("*.json"):
+        if path.name in _NON_CATEGORY_FILES:
+            continue
+        for entry in _load(path):
+            name = entry.get("name") if isinstance(entry, dict) else entry
+            if isinstance(name, str) and name.lower() == target:
+                return path.stem
+    return None
+
+
 def _save(path: _pl.Path, data: list) -> None:
+    if _orjson is not None:
+        path.write_bytes(_orjson.dumps(data, option=_orjson.OPT_INDENT_2))
+        return
     with path.open("w", encoding="utf-8") as f:
         _json.dump(data, f, indent=2, ensure_ascii=False)
 
@@ -210,8 +280,14 @@ def main() -> None:
         _sys.stderr.write("Object name cannot be empty.\n")
         _sys.exit(1)
 
+    # Duplicate check across every category *before* spending an LLM call
+    existing_category = _find_existing(obj_name)
+    if existing_category is not None:
+        print(f"⚠️  '{obj_name}' already exists in category '{existing_category}'. Nothing was added.")
+        return
+
     existing_cats = [p.stem for p in _DATA_DIR.glob("*.json")]
-    category = infer_category(obj_name, existing_cats)
+    category, description = categorise_and_describe(obj_name, existing_cats)
     file_path = _DATA_DIR / f"{category}.json"
 
     entries = _load(file_path)
@@ -224,7 +300,6 @@ def main() -> None:
         print(f"⚠️  '{obj_name}' already exists in category '{category}'. Nothing was added.")
         return
 
-    description = generate_description(obj_name)
     new_entry = {
         "name": obj_name,
         "description": description,